@@ -1,6 +1,8 @@
 import pygame
 import random
 import sys
+import tracemalloc
+from array import array
 from enum import Enum
 
 # Initialize Pygame
@@ -25,6 +27,176 @@ class Difficulty(Enum):
     HARD = 3
     EXPERT = 4
 
+def pack_cell(x, y):
+    """Pack grid coordinates into a single uint32 cell key"""
+    return ((y & 0xFFFF) << 16) | (x & 0xFFFF)
+
+def unpack_cell(cell):
+    """Unpack a uint32 cell key back into (x, y) grid coordinates"""
+    x = cell & 0xFFFF
+    y = cell >> 16
+    # Coordinates are signed 16-bit so off-board positions survive a round trip
+    if x >= 0x8000:
+        x -= 0x10000
+    if y >= 0x8000:
+        y -= 0x10000
+    return (x, y)
+
+class CellBitset:
+    """Set of board cells stored as one bit per cell"""
+    
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._bits = bytearray((width * height + 7) // 8)
+        self._size = 0
+    
+    def add(self, cell):
+        """Mark a board cell as set"""
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"cell {cell} is outside the board")
+        index = y * self.width + x
+        mask = 1 << (index & 7)
+        if not self._bits[index >> 3] & mask:
+            self._bits[index >> 3] |= mask
+            self._size += 1
+    
+    def discard(self, cell):
+        """Clear a board cell if it is set"""
+        if cell in self:
+            index = cell[1] * self.width + cell[0]
+            self._bits[index >> 3] &= ~(1 << (index & 7))
+            self._size -= 1
+    
+    def __contains__(self, cell):
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        index = y * self.width + x
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+    
+    def __iter__(self):
+        for byte_index, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    index = (byte_index << 3) | bit
+                    yield (index % self.width, index // self.width)
+    
+    def __len__(self):
+        return self._size
+
+class SnakeBody:
+    """Snake segments stored as packed uint32 cells in a growable ring buffer
+
+    Segments are kept head first. Occupied board cells are tracked in a
+    CellBitset (one bit per cell), and the rare cells holding more than one
+    segment, or segments that have left the board while invincible, are
+    counted in small dicts keyed by packed cell. Membership and
+    self-collision checks are O(1). Board dimensions are limited to 32767
+    cells per side by the 16-bit coordinate packing.
+    """
+    
+    def __init__(self, width, height, capacity=64):
+        self.width = width
+        self.height = height
+        self._cells = array('I', [0]) * capacity
+        self._start = 0
+        self._length = 0
+        self._occupied = CellBitset(width, height)
+        self._overlaps = {}
+        self._off_board = {}
+    
+    def _on_board(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def _grow(self):
+        """Double the ring buffer capacity, unrolling it to start at 0"""
+        cells = self._cells
+        capacity = len(cells)
+        self._cells = cells[self._start:] + cells[:self._start] + array('I', [0]) * capacity
+        self._start = 0
+    
+    def _track(self, segment, cell):
+        """Record one more segment at the given cell"""
+        if not self._on_board(*segment):
+            self._off_board[cell] = self._off_board.get(cell, 0) + 1
+        elif segment in self._occupied:
+            self._overlaps[cell] = self._overlaps.get(cell, 0) + 1
+        else:
+            self._occupied.add(segment)
+    
+    def _untrack(self, segment, cell):
+        """Record one less segment at the given cell"""
+        counts = self._off_board if not self._on_board(*segment) else self._overlaps
+        if cell in counts:
+            counts[cell] -= 1
+            if not counts[cell]:
+                del counts[cell]
+        else:
+            self._occupied.discard(segment)
+    
+    def push_head(self, segment):
+        """Add a new head segment"""
+        if self._length == len(self._cells):
+            self._grow()
+        cell = pack_cell(*segment)
+        self._start = (self._start - 1) % len(self._cells)
+        self._cells[self._start] = cell
+        self._length += 1
+        self._track(segment, cell)
+    
+    def pop_tail(self):
+        """Remove and return the tail segment"""
+        if not self._length:
+            raise IndexError("pop from empty snake")
+        self._length -= 1
+        cell = self._cells[(self._start + self._length) % len(self._cells)]
+        segment = unpack_cell(cell)
+        self._untrack(segment, cell)
+        return segment
+    
+    @property
+    def head(self):
+        """Current head segment"""
+        return self[0]
+    
+    def count(self, segment):
+        """Number of segments occupying the given cell"""
+        cell = pack_cell(*segment)
+        if not self._on_board(*segment):
+            return self._off_board.get(cell, 0)
+        if segment not in self._occupied:
+            return 0
+        return 1 + self._overlaps.get(cell, 0)
+    
+    def cells(self):
+        """Iterate packed uint32 cells from head to tail"""
+        cells = self._cells
+        capacity = len(cells)
+        start = self._start
+        for i in range(self._length):
+            yield cells[(start + i) % capacity]
+    
+    def __len__(self):
+        return self._length
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("snake segment index out of range")
+        return unpack_cell(self._cells[(self._start + i) % len(self._cells)])
+    
+    def __iter__(self):
+        for cell in self.cells():
+            yield unpack_cell(cell)
+    
+    def __contains__(self, segment):
+        return self.count(segment) > 0
+
 class SnakeGame:
     def __init__(self):
         # Window settings
@@ -73,7 +245,7 @@ class SnakeGame:
         self.difficulty = Difficulty.MEDIUM
         self.score = 0
         self.high_scores = self.load_high_scores()
-        self.snake = []
+        self.snake = SnakeBody(self.GRID_WIDTH, self.GRID_HEIGHT)
         self.food = None
         self.direction = Direction.RIGHT
         self.game_speed = self.difficulty_speeds[self.difficulty]
@@ -101,7 +273,8 @@ class SnakeGame:
     
     def reset_game(self):
         """Reset game state"""
-        self.snake = [(self.GRID_WIDTH // 2, self.GRID_HEIGHT // 2)]
+        self.snake = SnakeBody(self.GRID_WIDTH, self.GRID_HEIGHT)
+        self.snake.push_head((self.GRID_WIDTH // 2, self.GRID_HEIGHT // 2))
         self.direction = Direction.RIGHT
         self.score = 0
         self.spawn_food()
@@ -132,7 +305,7 @@ class SnakeGame:
     
     def move_snake(self):
         """Move the snake"""
-        head = self.snake[0]
+        head = self.snake.head
         
         if self.direction == Direction.UP:
             new_head = (head[0], head[1] - 1)
@@ -145,16 +318,16 @@ class SnakeGame:
         
         # Check for food collision
         if new_head == self.food:
-            self.snake.insert(0, new_head)
+            self.snake.push_head(new_head)
             self.score += 10
             self.spawn_food()
         else:
-            self.snake.insert(0, new_head)
-            self.snake.pop()
+            self.snake.push_head(new_head)
+            self.snake.pop_tail()
     
     def check_collisions(self):
         """Check for collisions"""
-        head = self.snake[0]
+        head = self.snake.head
         
         # Check wall collision
         if (head[0] < 0 or head[0] >= self.GRID_WIDTH or
@@ -162,7 +335,7 @@ class SnakeGame:
             return True
         
         # Check self collision
-        if head in self.snake[1:]:
+        if self.snake.count(head) > 1:
             return True
         
         return False
@@ -392,7 +565,7 @@ class SnakeGameWithPowerUps(SnakeGame):
         super().__init__()
         self.power_up = None
         self.power_up_timer = 0
-        self.obstacles = []
+        self.obstacles = CellBitset(self.GRID_WIDTH, self.GRID_HEIGHT)
         self.speed_boost = False
         self.invincible = False
         
@@ -401,7 +574,7 @@ class SnakeGameWithPowerUps(SnakeGame):
         super().reset_game()
         self.power_up = None
         self.power_up_timer = 0
-        self.obstacles = []
+        self.obstacles = CellBitset(self.GRID_WIDTH, self.GRID_HEIGHT)
         self.speed_boost = False
         self.invincible = False
         
@@ -418,7 +591,7 @@ class SnakeGameWithPowerUps(SnakeGame):
                 x = random.randint(0, self.GRID_WIDTH - 1)
                 y = random.randint(0, self.GRID_HEIGHT - 1)
                 if (x, y) not in self.snake and (x, y) != self.food:
-                    self.obstacles.append((x, y))
+                    self.obstacles.add((x, y))
                     break
     
     def spawn_power_up(self):
@@ -434,7 +607,7 @@ class SnakeGameWithPowerUps(SnakeGame):
     
     def move_snake(self):
         """Move snake with power-up effects"""
-        head = self.snake[0]
+        head = self.snake.head
         
         if self.direction == Direction.UP:
             new_head = (head[0], head[1] - 1)
@@ -452,13 +625,13 @@ class SnakeGameWithPowerUps(SnakeGame):
         
         # Check for food collision
         if new_head == self.food:
-            self.snake.insert(0, new_head)
+            self.snake.push_head(new_head)
             self.score += 10
             self.spawn_food()
             self.spawn_power_up()
         else:
-            self.snake.insert(0, new_head)
-            self.snake.pop()
+            self.snake.push_head(new_head)
+            self.snake.pop_tail()
     
     def activate_power_up(self, power_type):
         """Activate power-up effects"""
@@ -485,7 +658,7 @@ class SnakeGameWithPowerUps(SnakeGame):
     
     def check_collisions(self):
         """Check collisions with power-up considerations"""
-        head = self.snake[0]
+        head = self.snake.head
         
         # Check wall collision
         if (head[0] < 0 or head[0] >= self.GRID_WIDTH or
@@ -493,7 +666,7 @@ class SnakeGameWithPowerUps(SnakeGame):
             return not self.invincible
         
         # Check self collision
-        if head in self.snake[1:]:
+        if self.snake.count(head) > 1:
             return not self.invincible
         
         # Check obstacle collision
@@ -636,8 +809,44 @@ class SnakeGameWithPowerUps(SnakeGame):
         pygame.quit()
         sys.exit()
 
+def benchmark_segment_memory(num_segments=1_000_000, side=4096):
+    """Compare per-segment memory of a list of tuples against SnakeBody
+
+    The board size is fixed independently of the segment count, so the
+    ring buffer cost per segment is reported apart from the occupancy
+    bitset, whose size depends only on the board.
+    """
+    def allocated_since(snapshot):
+        return sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+    
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    segments = [(i % side, i // side) for i in range(num_segments)]
+    list_bytes = allocated_since(snapshot)
+    del segments
+    
+    snapshot = tracemalloc.take_snapshot()
+    body = SnakeBody(side, side)
+    occupancy_bytes = allocated_since(snapshot)
+    
+    snapshot = tracemalloc.take_snapshot()
+    for i in range(num_segments):
+        body.push_head((i % side, i // side))
+    ring_bytes = allocated_since(snapshot)
+    del body
+    tracemalloc.stop()
+    
+    print(f"Segments: {num_segments:,} on a {side:,} x {side:,} board")
+    print(f"list of tuples:        {list_bytes / num_segments:.1f} bytes/segment")
+    print(f"SnakeBody ring buffer: {ring_bytes / num_segments:.1f} bytes/segment")
+    print(f"SnakeBody occupancy:   {occupancy_bytes:,} bytes (fixed per board)")
+
 def main():
     """Main function to run the game"""
+    if "--bench-memory" in sys.argv:
+        benchmark_segment_memory()
+        return
+    
     print("🎮 Snake Game")
     print("=" * 40)
     print("1. Classic Snake")